@@ -81,6 +81,16 @@ class GoBoard(object):
         b.board = np.copy(self.board)
         return b
 
+    @property
+    def board2d(self) -> np.ndarray:
+        """
+        Return a two dimensional view of the board without BORDER points,
+        with row 1 at the bottom as in GoGui, see GoBoardUtil.get_twoD_board.
+        The view shares memory with self.board, so nothing is copied.
+        """
+        square = self.board[: self.NS * self.NS].reshape(self.NS, self.NS)
+        return square[:0:-1, 1:]
+
     def get_color(self, point: GO_POINT) -> GO_COLOR:
         return self.board[point]
 
@@ -311,52 +321,24 @@ class GoBoard(object):
         self.board[point] = color
         total_capture = 0
         opp_color = opponent(color)
-        all_neighbors = self._neighbors(point) + self._diag_neighbors(point)
-        direction_index = 1
-        for neighbor in all_neighbors:
+        # the offsets of the four neighbors followed by the four diagonal neighbors
+        shifts = (
+            -1,
+            1,
+            -self.NS,
+            self.NS,
+            -self.NS - 1,
+            -self.NS + 1,
+            self.NS - 1,
+            self.NS + 1,
+        )
+        for shift in shifts:
             capture_count = 0
+            neighbor = point + shift
             if self.board[neighbor] == opp_color:
-                if direction_index == 1:
-                    capture_count = self.capture(
-                        self.back_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 2:
-                    capture_count = self.capture(
-                        self.front_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 3:
-                    capture_count = self.capture(
-                        self.down_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 4:
-                    capture_count = self.capture(
-                        self.up_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 5:
-                    capture_count = self.capture(
-                        self.down_left_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 6:
-                    capture_count = self.capture(
-                        self.down_right_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 7:
-                    capture_count = self.capture(
-                        self.up_left_check(neighbor, opp_color, color)
-                    )
-
-                elif direction_index == 8:
-                    capture_count = self.capture(
-                        self.up_right_check(neighbor, opp_color, color)
-                    )
-
-            direction_index += 1
+                capture_count = self.capture(
+                    self.sandwich_check(neighbor, shift, opp_color, color)
+                )
             # self.ko_recapture =NO_POINT
             total_capture += capture_count
             self.current_player = opponent(color)
@@ -373,154 +355,18 @@ class GoBoard(object):
                 self.board[node] = EMPTY
                 capture_count += 1
         return capture_count
-        """
-        for node in changed_list:
-            self.board[node] = EMPTY
-            capture_count += 1
-        return capture_count
-        
-        """
-
-    def down_left_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor - (count * self.NS) - count] == opp_color:
-                changed_list.append(neighbor - (count * self.NS) - count)
-            elif self.board[neighbor - (count * self.NS) - count] == color:
-                break
-            elif (
-                self.board[neighbor - (count * self.NS) - count] == BORDER
-                or self.board[neighbor - (count * self.NS) - count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def down_right_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor - (count * self.NS) + count] == opp_color:
-                changed_list.append(neighbor - (count * self.NS) + count)
-            elif self.board[neighbor - (count * self.NS) + count] == color:
-                break
-            elif (
-                self.board[neighbor - (count * self.NS) + count] == BORDER
-                or self.board[neighbor - (count * self.NS) + count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def up_left_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor + (count * self.NS) - count] == opp_color:
-                changed_list.append(neighbor + (count * self.NS) - count)
-            elif self.board[neighbor + (count * self.NS) - count] == color:
-                break
-            elif (
-                self.board[neighbor + (count * self.NS) - count] == BORDER
-                or self.board[neighbor + (count * self.NS) - count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
 
-    def up_right_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor + (count * self.NS) + count] == opp_color:
-                changed_list.append(neighbor + (count * self.NS) + count)
-            elif self.board[neighbor + (count * self.NS) + count] == color:
-                break
-            elif (
-                self.board[neighbor + (count * self.NS) + count] == BORDER
-                or self.board[neighbor + (count * self.NS) + count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def back_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor - count] == opp_color:
-                changed_list.append(neighbor - count)
-            elif self.board[neighbor - count] == color:
-                break
-            elif (
-                self.board[neighbor - count] == BORDER
-                or self.board[neighbor - count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def front_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor + count] == opp_color:
-                changed_list.append(neighbor + count)
-            elif self.board[neighbor + count] == color:
-                break
-            elif (
-                self.board[neighbor + count] == BORDER
-                or self.board[neighbor + count] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def down_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor - (count * self.NS)] == opp_color:
-                changed_list.append(neighbor - (count * self.NS))
-            elif self.board[neighbor - (count * self.NS)] == color:
-                break
-            elif (
-                self.board[neighbor - (count * self.NS)] == BORDER
-                or self.board[neighbor - (count * self.NS)] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
-        return changed_list
-
-    def up_check(self, neighbor, opp_color, color):
-        changed_list = []
-        count = 1
-        changed_list.append(neighbor)
-        while 1:
-            if self.board[neighbor + (count * self.NS)] == opp_color:
-                changed_list.append(neighbor + (count * self.NS))
-            elif self.board[neighbor + (count * self.NS)] == color:
-                break
-            elif (
-                self.board[neighbor + (count * self.NS)] == BORDER
-                or self.board[neighbor + (count * self.NS)] == EMPTY
-            ):
-                changed_list = []
-                break
-            count += 1
+    def sandwich_check(self, neighbor, shift, opp_color, color):
+        """
+        Walk from neighbor in steps of shift over stones of opp_color.
+        Return the stones walked over if the line ends at a stone of color,
+        or an empty list if it ends at an EMPTY or BORDER point.
+        """
+        changed_list = [neighbor]
+        point = neighbor + shift
+        while self.board[point] == opp_color:
+            changed_list.append(point)
+            point += shift
+        if self.board[point] != color:
+            return []
         return changed_list
@@ -85,10 +85,4 @@ class GoBoardUtil(object):
         Then the board is flipped up-down to be consistent with the
         coordinate system in GoGui (row 1 at the bottom).
         """
-        size: int = go_board.size
-        board2d: np.ndarray[GO_POINT] = np.zeros((size, size), dtype=GO_POINT)
-        for row in range(size):
-            start: int = go_board.row_start(row + 1)
-            board2d[row, :] = go_board.board[start : start + size]
-        board2d = np.flipud(board2d)
-        return board2d
+        return go_board.board2d.copy()
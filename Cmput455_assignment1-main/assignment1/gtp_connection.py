@@ -25,15 +25,51 @@ from board_base import (
     GO_POINT,
     PASS,
     MAXSIZE,
+    board_array_size,
     coord_to_point,
-    opponent,
+    is_black_white,
+    where1d,
 )
 from board import GoBoard
-from board_util import GoBoardUtil
 from engine import GoEngine
+from win_check import five_through
+
+_COLOR_NAME: Dict[GO_COLOR, str] = {BLACK: "black", WHITE: "white"}
+_COLOR_TO_INT: Dict[str, GO_COLOR] = {
+    "b": BLACK,
+    "w": WHITE,
+    "e": EMPTY,
+    "BORDER": BORDER,
+}
+_LEADING_DIGITS = re.compile(r"^\d+")
+# translation table from point colors to gogui-rules_board characters
+_BOARD_CHARS = bytes.maketrans(bytes([EMPTY, BLACK, WHITE]), b".XO")
+
+
+def _no_arg_error(argnum: int) -> bool:
+    """Argument check for commands that are not in argmap"""
+    return False
 
 
 class GtpConnection:
+    __slots__ = (
+        "B",
+        "W",
+        "_debug_mode",
+        "_out_buf",
+        "_err_buf",
+        "go_engine",
+        "board",
+        "black_bb",
+        "white_bb",
+        "_winner",
+        "_legal_cache",
+        "_point_to_str",
+        "commands",
+        "argmap",
+        "_validators",
+    )
+
     def __init__(
         self, go_engine: GoEngine, board: GoBoard, debug_mode: bool = False
     ) -> None:
@@ -47,12 +83,23 @@ class GtpConnection:
         board:
             Represents the current board state.
         """
-        # self.BW_count = [0,0]
         self.B = 0
         self.W = 0
         self._debug_mode: bool = debug_mode
+        # output is buffered and written once per command, see flush
+        self._out_buf: List[str] = []
+        self._err_buf: List[str] = []
         self.go_engine = go_engine
         self.board: GoBoard = board
+        # bitboards of the stones of each color, bit i is GO_POINT i
+        self.black_bb: int = 0
+        self.white_bb: int = 0
+        # color with five in a row, updated by every move
+        self._winner: GO_COLOR = EMPTY
+        # sorted legal moves string per color, cleared when the board changes
+        self._legal_cache: Dict[GO_COLOR, str] = {}
+        # GTP string of each GO_POINT, rebuilt when the board size changes
+        self._point_to_str: np.ndarray = point_table(self.board.size)
         self.commands: Dict[str, Callable[[List[str]], None]] = {
             "protocol_version": self.protocol_version_cmd,
             "quit": self.quit_cmd,
@@ -88,22 +135,37 @@ class GtpConnection:
             "play": (2, "Usage: play {b,w} MOVE"),
             "legal_moves": (1, "Usage: legal_moves {w,b}"),
         }
+        # argument checks built from argmap, looked up once per command
+        self._validators: Dict[str, Callable[[int], bool]] = {
+            cmd: self.arg_validator(argnum, msg)
+            for cmd, (argnum, msg) in self.argmap.items()
+        }
 
     def write(self, data: str) -> None:
-        stdout.write(data)
+        self._out_buf.append(data)
 
     def flush(self) -> None:
-        stdout.flush()
+        """
+        Write all buffered output. GTP is strictly request/response,
+        so this is done once per command.
+        """
+        if self._err_buf:
+            stderr.write("".join(self._err_buf))
+            stderr.flush()
+            self._err_buf.clear()
+        if self._out_buf:
+            stdout.write("".join(self._out_buf))
+            stdout.flush()
+            self._out_buf.clear()
 
     def start_connection(self) -> None:
         """
         Start a GTP connection.
         This function continuously monitors standard input for commands.
         """
-        line = stdin.readline()
-        while line:
-            self.get_cmd(line)
-            line = stdin.readline()
+        get_cmd = self.get_cmd
+        for line in stdin:
+            get_cmd(line)
 
     def get_cmd(self, command: str) -> None:
         """
@@ -115,61 +177,79 @@ class GtpConnection:
             return
         # Strip leading numbers from regression tests
         if command[0].isdigit():
-            command = re.sub("^\d+", "", command).lstrip()
+            command = _LEADING_DIGITS.sub("", command).lstrip()
 
         elements: List[str] = command.split()
         if not elements:
             return
         command_name: str = elements[0]
         args: List[str] = elements[1:]
-        if self.has_arg_error(command_name, len(args)):
-            return
-        if command_name in self.commands:
-            try:
-                self.commands[command_name](args)
-            except Exception as e:
-                self.debug_msg("Error executing command {}\n".format(str(e)))
-                self.debug_msg("Stack Trace:\n{}\n".format(traceback.format_exc()))
-                raise e
-        else:
-            self.debug_msg("Unknown command: {}\n".format(command_name))
-            self.error("Unknown command")
-            stdout.flush()
+        try:
+            validator = self._validators.get(command_name, _no_arg_error)
+            if validator(len(args)):
+                return
+            cmd = self.commands.get(command_name)
+            if cmd is not None:
+                try:
+                    cmd(args)
+                except Exception as e:
+                    self.debug_msg("Error executing command {}\n".format(str(e)))
+                    self.debug_msg(
+                        "Stack Trace:\n{}\n".format(traceback.format_exc())
+                    )
+                    raise e
+            else:
+                self.debug_msg("Unknown command: {}\n".format(command_name))
+                self.error("Unknown command")
+        finally:
+            self.flush()
 
-    def has_arg_error(self, cmd: str, argnum: int) -> bool:
+    def arg_validator(self, required_args: int, msg: str) -> Callable[[int], bool]:
         """
-        Verify the number of arguments of cmd.
-        argnum is the number of parsed arguments
+        Return a function that verifies the number of arguments of a command.
+        It is called with the number of parsed arguments, and reports msg
+        and returns True if that is not required_args.
         """
-        if cmd in self.argmap and self.argmap[cmd][0] != argnum:
-            self.error(self.argmap[cmd][1])
-            return True
-        return False
+
+        def has_arg_error(argnum: int) -> bool:
+            if argnum != required_args:
+                self.error(msg)
+                return True
+            return False
+
+        return has_arg_error
 
     def debug_msg(self, msg: str) -> None:
         """Write msg to the debug stream"""
         if self._debug_mode:
-            stderr.write(msg)
-            stderr.flush()
+            self._err_buf.append(msg)
 
     def error(self, error_msg: str) -> None:
         """Send error msg to stdout"""
-        stdout.write("? {}\n\n".format(error_msg))
-        stdout.flush()
+        self.write("? {}\n\n".format(error_msg))
 
     def respond(self, response: str = "") -> None:
         """Send response to stdout"""
-        stdout.write("= {}\n\n".format(response))
-        stdout.flush()
+        self.write("= {}\n\n".format(response))
 
     def reset(self, size: int) -> None:
         """
         Reset the board to empty board of given size
         """
         self.board.reset(size)
+        self.black_bb = 0
+        self.white_bb = 0
+        self._winner = EMPTY
+        self._board_changed()
+
+    def _board_changed(self) -> None:
+        """
+        Invalidate everything computed from the previous board
+        """
+        self._legal_cache.clear()
 
     def board2d(self) -> str:
-        return str(GoBoardUtil.get_twoD_board(self.board))
+        return str(self.board.board2d)
 
     def protocol_version_cmd(self, args: List[str]) -> None:
         """Return the GTP protocol version being used (always 2)"""
@@ -190,7 +270,6 @@ class GtpConnection:
 
     def clear_board_cmd(self, args: List[str]) -> None:
         """clear the board"""
-        # self.BW_count = [0, 0]
         self.B = 0
         self.W = 0
         self.reset(self.board.size)
@@ -200,7 +279,12 @@ class GtpConnection:
         """
         Reset the game with new boardsize args[0]
         """
-        self.reset(int(args[0]))
+        size = int(args[0])
+        if not 2 <= size <= MAXSIZE:
+            self.error(f"boardsize must be between 2 and {MAXSIZE}")
+            return
+        self._point_to_str = point_table(size)
+        self.reset(size)
         self.respond()
 
     def showboard_cmd(self, args: List[str]) -> None:
@@ -232,13 +316,7 @@ class GtpConnection:
         """
         board_color: str = args[0].lower()
         color: GO_COLOR = color_to_int(board_color)
-        moves: List[GO_POINT] = GoBoardUtil.generate_legal_moves(self.board, color)
-        gtp_moves: List[str] = []
-        for move in moves:
-            coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-            gtp_moves.append(format_point(coords))
-        sorted_moves = " ".join(sorted(gtp_moves))
-        self.respond(sorted_moves)
+        self.respond(self.sorted_legal_moves(color))
 
     """
     ==========================================================================
@@ -272,28 +350,18 @@ class GtpConnection:
 
     def gogui_rules_side_to_move_cmd(self, args: List[str]) -> None:
         """We already implemented this function for Assignment 1"""
-        color = "black" if self.board.current_player == BLACK else "white"
-        self.respond(color)
+        self.respond(_COLOR_NAME[self.board.current_player])
 
     def gogui_rules_board_cmd(self, args: List[str]) -> None:
         """We already implemented this function for Assignment 1"""
         size = self.board.size
-        str = ""
+        rows: List[str] = []
         for row in range(size - 1, -1, -1):
             start = self.board.row_start(row + 1)
-            for i in range(size):
-                # str += '.'
-                point = self.board.board[start + i]
-                if point == BLACK:
-                    str += "X"
-                elif point == WHITE:
-                    str += "O"
-                elif point == EMPTY:
-                    str += "."
-                else:
-                    assert False
-            str += "\n"
-        self.respond(str)
+            points = self.board.board[start : start + size].astype(np.uint8)
+            rows.append(points.tobytes().translate(_BOARD_CHARS).decode())
+        rows.append("")
+        self.respond("\n".join(rows))
 
     """
     ==========================================================================
@@ -303,148 +371,34 @@ class GtpConnection:
 
     def gogui_rules_final_result_cmd(self, args: List[str]) -> None:
         """Implement this function for Assignment 1"""
-        draw = False
-        found = False
-        temp_board = GoBoardUtil.get_twoD_board(
-            self.board
-        )  # GoBoardUtil.get_twoD_board(self.board)
-        # return a 2-dim array, 0 is row and 1 is col
-        # print(GoBoardUtil.get_twoD_board(self.board))
-        count = 0
-        index = len(temp_board)
-        for row in range(index):
-            if count == index:
-                draw = True
-            if 0 not in temp_board[row]:
-                count += 1
-            if found == True:
-                break
-            for col in range(index):
-                color = temp_board[row][col]
-                if color != EMPTY:
-                    if self.go_through_down(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_up(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_left(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_right(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_NW(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_NE(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_SE(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-                    if self.go_through_SW(temp_board, row, col, color, index):
-                        if color == 1:
-                            self.respond("black")
-                        else:
-                            self.respond("white")
-                        found = True
-                        return 0
-        if draw == False:
-            if self.B == 10:
-                self.respond("white")
-                return
-            elif self.W == 10:
-                self.respond("black")
-                return
-            else:
-                self.respond("unknown")
-                return
-
-        if draw == True:
+        winner = self.game_winner()
+        if winner != EMPTY:
+            self.respond(_COLOR_NAME[winner])
+        elif EMPTY not in self.board.board2d:
             self.respond("Draw")
-            return None
-
-    def temp_result(self):
-        temp_board = GoBoardUtil.get_twoD_board(self.board)
-        index = len(temp_board[0])
-
-        break_outer_loop = False
-        # CHECK whether there are 5 same color
-        for row in range(index):
-            if break_outer_loop == True:
-                break
-            for col in range(index):
-                color = temp_board[row][col]
-                if color != EMPTY:
-                    if self.go_through_down(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_up(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_left(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_right(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_NW(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_NE(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_SE(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
-                    if self.go_through_SW(temp_board, row, col, color, index):
-                        if color == 1:
-                            return 1
-                        else:
-                            return 2
+        else:
+            self.respond("unknown")
+
+    def game_winner(self) -> GO_COLOR:
+        """
+        Return the color that won by five in a row or by capturing
+        10 stones, or EMPTY if the game is not won
+        """
+        if self._winner != EMPTY:
+            return self._winner
+        if self.B >= 10:
+            return WHITE
+        if self.W >= 10:
+            return BLACK
+        return EMPTY
+
+    def bitboard_winner(self) -> GO_COLOR:
+        """Rescan both bitboards for five in a row, checking black first"""
+        if has_five(self.black_bb, self.board.NS):
+            return BLACK
+        if has_five(self.white_bb, self.board.NS):
+            return WHITE
+        return EMPTY
 
     def gogui_rules_legal_moves_cmd(self, args: List[str]) -> None:
         """Implement this function for Assignment 1"""
@@ -453,215 +407,55 @@ class GtpConnection:
         return a list of all empty points on the board in sorted order.
         In the starter code, this command always returns an empty list.
         """
-        temp_board = GoBoardUtil.get_twoD_board(self.board)
-        index = len(temp_board[0])
-        win_color = None
-        break_outer_loop = False
-        # CHECK whether there are 5 same color
-        if self.B == 10:
+        if self.game_winner() != EMPTY:
             self.respond()
             return
-        elif self.W == 10:
-            self.respond()
-            return 
-        for row in range(index):
-            if break_outer_loop == True:
-                break
-            for col in range(index):
-                color = temp_board[row][col]
-                if color != EMPTY:
-                    if self.go_through_down(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_up(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_left(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_right(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_NW(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_NE(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_SE(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-                    if self.go_through_SW(temp_board, row, col, color, index):
-                        self.respond()
-                        return
-        legal_moves_list = self.legal_move()
-        # sort in alphabetic order.
-        sorted_moves = " ".join(sorted(legal_moves_list))
-        self.respond(str(sorted_moves))
-        
-
-    def legal_move(self):
-        current_play = self.board.current_player
-        # return legal moves
-
-        legal_moves = GoBoardUtil.generate_legal_moves(self.board, current_play)
-        legal_moves_list = []
-
-        for move in legal_moves:
-            pos = point_to_coord(move, self.board.size)
-            legal_moves_list.append(format_point(pos))
-        return legal_moves_list
-
-    def go_through_up(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (row - 1) >= 0:
-            if temp_board[row - 1][col] == target_color:
-                temp_count += 1
-                row -= 1
-            else:
-                return False
-            # return if count 5 same stones
-            if temp_count >= 5:
-                go_through = False
-                return True
-
-            # return if it is out of range
-            if row < 0:
-                return False
-
-    def go_through_down(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        # need to check whether it is out of range on next step
-        while go_through == True and (row + 1) < index:
-            if temp_board[row + 1][col] == target_color:
-                temp_count += 1
-                row += 1
-                go_through = True
-            else:
-                return False
-            if temp_count >= 5:
-                go_through = False
-                return True
-
-            if row >= index:
-                return False
-
-    def go_through_left(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (col - 1) >= 0:
-            if temp_board[row][col - 1] == target_color:
-                temp_count += 1
-                col -= 1
-                go_through = True
-            else:
-                return False
-            if temp_count >= 5:
-                go_through = False
-                return True
-
-            if col < 0:
-                return False
-
-    def go_through_right(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (col + 1) < index:
-            if temp_board[row][col + 1] == target_color:
-                temp_count += 1
-                col += 1
-                go_through = True
-            else:
-                return False
-            if temp_count >= 5:
-                go_through = False
-                return True
-
-            if col >= index:
-                return False
-
-    def go_through_NW(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (row - 1) >= 0 and (col + 1) < index:
-            if temp_board[row - 1][col + 1] == target_color:
-                temp_count += 1
-                col += 1
-                row -= 1
-                go_through = True
-            else:
-                return False
-            if temp_count >= 5:
-                go_through = False
-                return True
-
-            if row < 0:
-                return False
-            if col >= index:
-                return False
-
-    def go_through_NE(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (row - 1) >= 0 and (col - 1) >= 0:
-            if temp_board[row - 1][col - 1] == target_color:
-                temp_count += 1
-                col -= 1
-                row -= 1
-                go_through = True
-            else:
-                return False
+        sorted_moves = self.sorted_legal_moves(self.board.current_player)
+        self.respond(sorted_moves)
 
-            if temp_count >= 5:
-                go_through = False
-                return True
+    def sorted_legal_moves(self, color: GO_COLOR) -> str:
+        """
+        Return the legal moves for color as one string in alphabetic order.
+        The string is cached until the board changes.
+        """
+        sorted_moves = self._legal_cache.get(color)
+        if sorted_moves is None:
+            sorted_moves = " ".join(sorted(self.legal_move()))
+            self._legal_cache[color] = sorted_moves
+        return sorted_moves
 
-            if row < 0:
-                return False
-            if col < 0:
-                return False
-
-    def go_through_SW(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (row + 1) < index and (col - 1) >= 0:
-            if temp_board[row + 1][col - 1] == target_color:
-                temp_count += 1
-                col -= 1
-                row += 1
-                go_through = True
-            else:
-                return False
+    def legal_move_points(self) -> np.ndarray:
+        # return legal moves, which in Ninuki are all the empty points
+        return self.board.get_empty_points()
 
-            if temp_count >= 5:
-                go_through = False
-                return True
+    def legal_move(self) -> List[str]:
+        return self._point_to_str[self.legal_move_points()].tolist()
 
-            if row >= index:
-                return False
-            if col < 0:
-                return False
-
-    def go_through_SE(self, temp_board, row, col, target_color, index):
-        temp_count = 1
-        go_through = True
-        while go_through == True and (row + 1) < index and (col + 1) < index:
-            if temp_board[row + 1][col + 1] == target_color:
-                temp_count += 1
-                col += 1
-                row += 1
-                go_through = True
-            else:
-                return False
-            if temp_count >= 5:
-                go_through = False
-                return True
-            if row >= index:
-                return False
-            if col >= index:
-                return False
+    def play_stone(self, move: GO_POINT, color: GO_COLOR) -> None:
+        """
+        Play move for color with Ninuki captures, and update the
+        capture counts and bitboards.
+        """
+        board = self.board
+        catch_arr = board.capture_by_a1(move, color)
+        self._board_changed()
+        if catch_arr[1] == BLACK:
+            self.W += catch_arr[0]
+            self.black_bb |= 1 << int(move)
+            if catch_arr[0]:
+                self.white_bb = bitboard(board.board, WHITE)
+        elif catch_arr[1] == WHITE:
+            self.B += catch_arr[0]
+            self.white_bb |= 1 << int(move)
+            if catch_arr[0]:
+                self.black_bb = bitboard(board.board, BLACK)
+        winner = self._winner
+        if catch_arr[0] and winner != EMPTY:
+            # the captured stones may have broken the winning row
+            winner = self.bitboard_winner()
+        if winner == EMPTY and five_through(board.board, move, color, board.NS):
+            winner = color
+        self._winner = winner
 
     def play_cmd(self, args: List[str]) -> None:
         """
@@ -673,86 +467,54 @@ class GtpConnection:
         board_move = args[1]
 
         error_list = ["wrong color", "wrong coordinate", "occupied"]
-        try:
-            # if not is_black_white(color):#return true if it is w or b, otherwise False
-            # pass
-            if color_to_int(board_color):
-                color = color_to_int(board_color)
-
-        except Exception as q:
+        color = _COLOR_TO_INT.get(board_color, EMPTY)
+        if not is_black_white(color):
             self.respond(f'Illegal Move: "{args}" {error_list[0]}')
             return
-        # move is a go point(int)
         try:
-            if move_to_coord(
-                args[1], self.board.size
-            ):  # move to coord can raise an error if cannot pass
-                coord = move_to_coord(args[1], self.board.size)
-
-        except Exception as w:
-            temp = str(f'Illegal Move: "{args}" {error_list[1]}')
-            self.respond(temp)
-            return  # return Go-point
-
-        legal_list = self.legal_move()
-        # print(legal_list)
-        if board_move.lower() == "pass":
+            coord = move_to_coord(board_move, self.board.size)
+        except ValueError:
+            self.respond(f'Illegal Move: "{args}" {error_list[1]}')
+            return
+        if coord[0] == PASS:
             self.board.play_move(PASS, color)
-            self.board.current_player = opponent(color)
             self.respond()
             return
         move = coord_to_point(coord[0], coord[1], self.board.size)
-        if board_move.upper() in legal_list:
-            catch_arr = self.board.capture_by_a1(move, color)
-            if catch_arr[1] == BLACK:
-                self.W += catch_arr[0]
-            elif catch_arr[1] == WHITE:
-                self.B += catch_arr[0]
+        if self.board.board[move] == EMPTY:
+            self.play_stone(move, color)
             self.respond()
         else:
-            temp = str("Illegal Move: {},{}".format(board_move, error_list[2]))
-            self.respond(temp)
-            return
+            self.respond(f"Illegal Move: {board_move},{error_list[2]}")
 
     def genmove_cmd(self, args: List[str]) -> None:
         """
         Modify this function for Assignment 1.
         Generate a move for color args[0] in {'b','w'}.
         """
-        legal_list = self.legal_move()
         board_color = args[0].lower()
         color = color_to_int(board_color)
-        move_as_string = random.choice(legal_list)
-        move_coord = move_to_coord(move_as_string, self.board.size)
         """
         move = self.go_engine.get_move(self.board, color)
         move_coord = point_to_coord(move, self.board.size)
 
         move_as_string = format_point(move_coord)
         """
-
-        check_move = coord_to_point(move_coord[0], move_coord[1], self.board.size)
-        if self.temp_result() == 1 or self.temp_result() == 2:
+        # the game is over after a win or a draw on a full board
+        if self.game_winner() != EMPTY or EMPTY not in self.board.board2d:
             self.respond("resign")
             return
-        if len(legal_list) != 0:
-            catch_arr = self.board.capture_by_a1(check_move, color)
-            if catch_arr[1] == BLACK:
-                self.W += catch_arr[0]
-            elif catch_arr[1] == WHITE:
-                self.B += catch_arr[0]
-            self.respond(str(move_as_string))
-        else:
-            temp = "Illegal move: {}".format(move_as_string)
-            self.respond(temp)
+        points = self.legal_move_points()
+        move = points[random.randrange(len(points))]
+        self.play_stone(move, color)
+        self.respond(self._point_to_str[move])
 
     def gogui_rules_captured_count_cmd(self, args: List[str]) -> None:
         """
         Modify this function for Assignment 1.
         Respond with the score for white, an space, and the score for black.
         """
-        temp = str("{} {}".format(self.B, self.W))
-        self.respond(temp)
+        self.respond(f"{self.B} {self.W}")
         # self.respond("[" + " ".join(map(str, self.B,self.W)) + "]")
 
     """
@@ -762,6 +524,45 @@ class GtpConnection:
     """
 
 
+def bitboard(board: np.ndarray, color: GO_COLOR) -> int:
+    """
+    Return a bitboard of the stones of color on the padded 1-d board,
+    with bit i set if GO_POINT i holds a stone of color.
+    """
+    bb = 0
+    for point in where1d(board == color):
+        bb |= 1 << int(point)
+    return bb
+
+
+def has_five(bb: int, NS: int) -> bool:
+    """
+    Check whether bitboard bb has five stones in a row.
+    The shifts 1, NS, NS - 1 and NS + 1 step along a row, a column and
+    the two diagonals of the padded board. The BORDER point between rows
+    is never set, so a run cannot wrap around from one row to the next.
+    """
+    for shift in (1, NS, NS - 1, NS + 1):
+        x = bb & (bb >> shift)
+        x &= x >> (2 * shift)
+        if x & (bb >> (4 * shift)):
+            return True
+    return False
+
+
+def point_table(boardsize: int) -> np.ndarray:
+    """
+    Return an array with the GTP string of every point on the board,
+    indexed by GO_POINT. Points off the board map to an empty string.
+    """
+    table = np.full(board_array_size(boardsize), "", dtype="<U3")
+    for row in range(1, boardsize + 1):
+        for col in range(1, boardsize + 1):
+            point = coord_to_point(row, col, boardsize)
+            table[point] = format_point((row, col))
+    return table
+
+
 def point_to_coord(point: GO_POINT, boardsize: int) -> Tuple[int, int]:
     """
     Transform point given as board array index
@@ -784,7 +585,7 @@ def format_point(move: Tuple[int, int]) -> str:
     if move[0] == PASS:
         return "PASS"
     row, col = move
-    if not 0 <= row < MAXSIZE or not 0 <= col < MAXSIZE:
+    if not 0 <= row <= MAXSIZE or not 0 <= col <= MAXSIZE:
         raise ValueError
     return column_letters[col - 1] + str(row)
 
@@ -819,5 +620,4 @@ def move_to_coord(point_str: str, board_size: int) -> Tuple[int, int]:
 
 def color_to_int(c: str) -> int:
     """convert character to the appropriate integer code"""
-    color_to_int = {"b": BLACK, "w": WHITE, "e": EMPTY, "BORDER": BORDER}
-    return color_to_int[c]
+    return _COLOR_TO_INT[c]
@@ -0,0 +1,33 @@
+"""
+win_check.py
+Five-in-a-row check for Ninuki on the padded 1-d board.
+The check runs for every move and only walks the lines
+through the stone that was just played.
+"""
+
+import numpy as np
+
+from board_base import GO_COLOR, GO_POINT
+
+
+def five_through(
+    board: np.ndarray, point: GO_POINT, color: GO_COLOR, NS: int
+) -> bool:
+    """
+    Check whether the stone of color on point is part of five in a row.
+    Only the four lines through point are walked, at most 4 points
+    each way; the BORDER padding stops every walk at the board edge.
+    """
+    for shift in (1, NS, NS - 1, NS + 1):
+        count = 1
+        p = point + shift
+        while count < 5 and board[p] == color:
+            count += 1
+            p += shift
+        p = point - shift
+        while count < 5 and board[p] == color:
+            count += 1
+            p -= shift
+        if count >= 5:
+            return True
+    return False